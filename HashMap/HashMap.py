@@ -1,84 +1,361 @@
+from array import array
+from operator import index as _int_hash
+
+class _Marker:
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+    # Copies and unpickled instances resolve to the module-level singleton
+    def __reduce__(self):
+        return self.name
+
+
+# Markers for slots in keys_array that were never used or have been removed
+_EMPTY = _Marker("_EMPTY")
+_DELETED = _Marker("_DELETED")
+
+# 2**64 divided by the golden ratio, for Fibonacci hashing
+_FIBONACCI = 0x9E3779B97F4A7C15
+_UINT64 = 0xFFFFFFFFFFFFFFFF
+
+
+# Linear probing: returns the slot holding key, or the empty slot ending its probe run
+def _probe(hashes, keys_array, mask, shift, key, key_hash):
+    index = ((key_hash * _FIBONACCI) & _UINT64) >> shift
+    k = keys_array[index]
+    while k is not _EMPTY:
+        # Identity first: interned strings and reused key objects skip __eq__.
+        # Tombstones keep their old hash, so rule them out before calling __eq__
+        if k is key or (hashes[index] == key_hash and k is not _DELETED and k == key):
+            return index
+        index = (index + 1) & mask
+        k = keys_array[index]
+    return index
+
+
+# Same as _probe, for tables whose keys are their own hashes
+def _probe_int(hashes, keys_array, mask, shift, key, key_hash):
+    index = ((key_hash * _FIBONACCI) & _UINT64) >> shift
+    k = keys_array[index]
+    while k is not _EMPTY:
+        if hashes[index] == key_hash and k is not _DELETED:
+            return index
+        index = (index + 1) & mask
+        k = keys_array[index]
+    return index
+
+
+# xxHash for bytes keys, falling back to hash() if the xxhash package is missing
+def _bytes_hash_function():
+    try:
+        from xxhash import xxh64_intdigest
+    except ImportError:
+        return hash
+
+    def bytes_hash(key):
+        # Shift the unsigned 64-bit digest into the signed range of the hashes array
+        return xxh64_intdigest(key) - 0x8000000000000000
+
+    return bytes_hash
+
+
+# Lookups with the probe inlined and a table's mask and shift written in as constants
+_SPECIALIZED_SOURCE = """
+def get(self, key):
+    key_hash = self._hash_function(key)
+    keys_array = self.keys_array
+    index = ((key_hash * {fibonacci}) & {uint64}) >> {shift}
+    k = keys_array[index]
+    while k is not _EMPTY:
+        if k is key or (
+            self.hashes[index] == key_hash and k is not _DELETED and k == key
+        ):
+            return self.values_array[index]
+        index = (index + 1) & {mask}
+        k = keys_array[index]
+    raise KeyError(f"Key {{key}} not found in HashMap.")
+
+
+def __contains__(self, key):
+    key_hash = self._hash_function(key)
+    keys_array = self.keys_array
+    index = ((key_hash * {fibonacci}) & {uint64}) >> {shift}
+    k = keys_array[index]
+    while k is not _EMPTY:
+        if k is key or (
+            self.hashes[index] == key_hash and k is not _DELETED and k == key
+        ):
+            return True
+        index = (index + 1) & {mask}
+        k = keys_array[index]
+    return False
+"""
+
+_specialized_classes = {}
+
+
+# Returns a subclass of cls with lookups compiled for a table of 2**log2cap slots
+def _specialize(cls, log2cap):
+    specialized = _specialized_classes.get((cls, log2cap))
+    if specialized is None:
+        source = _SPECIALIZED_SOURCE.format(
+            fibonacci=_FIBONACCI,
+            uint64=_UINT64,
+            mask=(1 << log2cap) - 1,
+            shift=64 - log2cap,
+        )
+        namespace = {"_EMPTY": _EMPTY, "_DELETED": _DELETED}
+        # Name the generated code so tracebacks say where it came from
+        exec(compile(source, f"<HashMap specialized 2**{log2cap}>", "exec"), namespace)
+        attributes = {
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "_generic_class": cls,
+        }
+        # Leave alone any lookup a subclass of HashMap has overridden
+        for name, function in (
+            ("get", namespace["get"]),
+            ("__getitem__", namespace["get"]),
+            ("__contains__", namespace["__contains__"]),
+        ):
+            if getattr(cls, name) is getattr(HashMap, name):
+                attributes[name] = function
+        specialized = type(cls.__name__, (cls,), attributes)
+        _specialized_classes[(cls, log2cap)] = specialized
+    return specialized
+
+
+# Attributes HashMap.__init__ and _allocate set up, which a pickled HashMap rebuilds
+# rather than carrying over. Any other instance attributes are pickled as state
+_TABLE_ATTRIBUTES = frozenset(
+    (
+        "size",
+        "used",
+        "key_type",
+        "log2cap",
+        "capacity",
+        "mask",
+        "shift",
+        "grow_at",
+        "hashes",
+        "keys_array",
+        "values_array",
+        "_hash_function",
+        "_probe",
+    )
+)
+
+
+# Rebuilds a pickled or copied HashMap by re-inserting its entries. Stored hashes
+# are not reused, since str and bytes hashes differ between processes
+def _unpickle(cls, capacity, key_type, keys, values):
+    hashmap = cls.__new__(cls)
+    HashMap.__init__(hashmap, capacity, key_type)
+    hashmap.put_many(keys, values)
+    return hashmap
+
+
 class HashMap:
-    def __init__(self, capacity):
-        self.capacity = capacity
+    _probe = staticmethod(_probe)
+    # Set on the subclasses made by _specialize to the class they specialize
+    _generic_class = None
+
+    def __init__(self, capacity, key_type=None):
         self.size = 0
-        self.buckets = [[] for _ in range(capacity)]
+        self.key_type = key_type
+        if key_type is int:
+            # Int keys are their own hash: skip hash() and compare only stored hashes
+            self._hash_function = _int_hash
+            self._probe = _probe_int
+        elif key_type is bytes:
+            self._hash_function = _bytes_hash_function()
+        self._allocate(capacity)
 
     def __len__(self):
         return self.size
 
+    # Specialized classes cannot be found by name, so pickle as the generic class
+    def __reduce__(self):
+        state = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in _TABLE_ATTRIBUTES
+        }
+        return (
+            _unpickle,
+            (
+                self._generic_class or type(self),
+                self.capacity,
+                self.key_type,
+                list(self.keys()),
+                list(self.values()),
+            ),
+            state,
+        )
+
+    # Restores the attributes a subclass added, on top of the rebuilt table
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
     # O(1) average case, O(n) worst case
     def __contains__(self, key):
-        index = self._hash_function(key)
-        bucket = self.buckets[index]
-        for k, v in bucket:
-            if k == key:
-                return True
-        return False
+        key_hash = self._hash_function(key)
+        index = self._probe(
+            self.hashes, self.keys_array, self.mask, self.shift, key, key_hash
+        )
+        return self.keys_array[index] is not _EMPTY
 
     # O(1) average case, O(n) worst case
     def put(self, key, value):
-        index = self._hash_function(key)
-        bucket = self.buckets[index]
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
-                bucket[i] = (key, value)
-                return
-        else:
-            bucket.append((key, value))
+        key_hash = self._hash_function(key)
+        index = self._probe(
+            self.hashes, self.keys_array, self.mask, self.shift, key, key_hash
+        )
+        if self.keys_array[index] is _EMPTY:
+            self.hashes[index] = key_hash
+            self.keys_array[index] = key
             self.size += 1
+            self.used += 1
+        self.values_array[index] = value
+        if self.used > self.grow_at:
+            self._resize(self.size * 3)
+
+    # O(n) time complexity if the table has to grow, O(1) otherwise
+    def sizehint(self, n):
+        # Make room for n entries in total without any further resizing
+        if self.used + max(n - self.size, 0) > self.grow_at:
+            self._resize(max(n, self.size) * 3 // 2 + 1)
+
+    # O(k) average case for k pairs
+    def put_many(self, keys, values):
+        if len(keys) != len(values):
+            raise ValueError("keys and values must have the same length")
+        # Grow once up front instead of checking the load factor after every pair
+        self.sizehint(self.size + len(keys))
+        hashes = self.hashes
+        keys_array = self.keys_array
+        values_array = self.values_array
+        mask = self.mask
+        shift = self.shift
+        probe = self._probe
+        added = 0
+        # Count what was written even if a later key cannot be hashed or stored
+        try:
+            for key, key_hash, value in zip(
+                keys, map(self._hash_function, keys), values
+            ):
+                index = probe(hashes, keys_array, mask, shift, key, key_hash)
+                if keys_array[index] is _EMPTY:
+                    hashes[index] = key_hash
+                    keys_array[index] = key
+                    added += 1
+                values_array[index] = value
+        finally:
+            self.size += added
+            self.used += added
 
     # O(1) average case, O(n) worst case
     def get(self, key):
-        index = self._hash_function(key)
-        bucket = self.buckets[index]
-        for k, v in bucket:
-            if k == key:
-                return v
-        raise KeyError(f"Key {key} not found in HashMap.")
+        key_hash = self._hash_function(key)
+        index = self._probe(
+            self.hashes, self.keys_array, self.mask, self.shift, key, key_hash
+        )
+        if self.keys_array[index] is _EMPTY:
+            raise KeyError(f"Key {key} not found in HashMap.")
+        return self.values_array[index]
 
     # O(1) average case, O(n) worst case
     def remove(self, key):
-        index = self._hash_function(key)
-        bucket = self.buckets[index]
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
-                del bucket[i]
-                self.size -= 1
-                break
-        else:
+        key_hash = self._hash_function(key)
+        index = self._probe(
+            self.hashes, self.keys_array, self.mask, self.shift, key, key_hash
+        )
+        if self.keys_array[index] is _EMPTY:
             raise KeyError(f"Key {key} not found in HashMap.")
+        # Leave a tombstone so probe sequences running through this slot stay intact
+        self.keys_array[index] = _DELETED
+        self.values_array[index] = None
+        self.size -= 1
+
+    # Subscript syntax (hashmap[key]) dispatches straight to the methods above
+    __getitem__ = get
+    __setitem__ = put
+    __delitem__ = remove
+
+    # O(n) time complexity
+    def __iter__(self):
+        return self.keys()
 
     # O(n) time complexity
     def keys(self):
-        keys_list = []
-        for bucket in self.buckets:
-            for k, v in bucket:
-                keys_list.append(k)
-        return keys_list
+        return (k for k in self.keys_array if k is not _EMPTY and k is not _DELETED)
 
     # O(n) time complexity
     def values(self):
-        values_list = []
-        for bucket in self.buckets:
-            for k, v in bucket:
-                values_list.append(v)
-        return values_list
+        return (
+            v
+            for k, v in zip(self.keys_array, self.values_array)
+            if k is not _EMPTY and k is not _DELETED
+        )
 
     # O(n) time complexity
     def items(self):
-        items_list = []
-        for bucket in self.buckets:
-            for k, v in bucket:
-                items_list.append((k, v))
-        return items_list
+        return (
+            (k, v)
+            for k, v in zip(self.keys_array, self.values_array)
+            if k is not _EMPTY and k is not _DELETED
+        )
 
     def _hash_function(self, key):
-        key_string = str(key)
-        hash_result = 0
-        for char in key_string:
-            hash_result = (hash_result * 31 + ord(char)) % self.capacity
-        return hash_result
+        return hash(key)
+
+    def _allocate(self, capacity):
+        # Round up to a power of two so the slot index is a bitmask
+        self.log2cap = max(capacity - 1, 0).bit_length()
+        self.capacity = 1 << self.log2cap
+        self.mask = self.capacity - 1
+        # Fibonacci hashing keeps the top log2cap bits of the mixed 64-bit hash
+        self.shift = 64 - self.log2cap
+        # Grow once two thirds of the slots are in use (live entries plus tombstones)
+        self.grow_at = self.capacity * 2 // 3
+        self.used = 0
+        self.hashes = array("q", [0]) * self.capacity
+        self.keys_array = [_EMPTY] * self.capacity
+        self.values_array = [None] * self.capacity
+        # The generated lookups inline the default probe, so only use them with it
+        if self._probe is _probe:
+            self.__class__ = _specialize(
+                self._generic_class or type(self), self.log2cap
+            )
+
+    # O(n) time complexity
+    def _resize(self, capacity):
+        entries = zip(self.hashes, self.keys_array, self.values_array)
+        self._allocate(capacity)
+        hashes = self.hashes
+        keys_array = self.keys_array
+        values_array = self.values_array
+        mask = self.mask
+        shift = self.shift
+        # Go through _probe so a subclass's probe sequence also places these entries
+        probe = self._probe
+        for key_hash, k, v in entries:
+            if k is _EMPTY or k is _DELETED:
+                continue
+            index = probe(hashes, keys_array, mask, shift, k, key_hash)
+            hashes[index] = key_hash
+            keys_array[index] = k
+            values_array[index] = v
+        self.used = self.size
+
+
+# HashMap for int keys that fit in 64 bits, using each key as its own hash
+class IntHashMap(HashMap):
+    def __init__(self, capacity):
+        super().__init__(capacity, key_type=int)
 
 
 if __name__ == "__main__":
@@ -93,10 +370,11 @@ if __name__ == "__main__":
     print(hashmap.get("orange"))  # Output: 3
     print(hashmap.get("strawberry"))  # Output: 4
 
-    print(hashmap.keys())  # Output: ['apple', 'banana', 'orange', 'strawberry']
-    print(hashmap.values())  # Output: [1, 2, 3, 4]
+    # Keys come back in slot order, which is not guaranteed and varies between runs
+    print(list(hashmap.keys()))  # Output, in some order: ['apple', 'banana', ...]
+    print(list(hashmap.values()))  # Output, in the same order: [1, 2, 3, 4]
     print(
-        hashmap.items()
-    )  # Output: [('apple', 1), ('banana', 2), ('orange', 3), ('strawberry', 4)]
+        list(hashmap.items())
+    )  # Output, in the same order: [('apple', 1), ('banana', 2), ...]
     hashmap.remove("banana")
     print(hashmap.get("banana"))  # Raises KeyError: Key banana not found in HashMap.
@@ -0,0 +1,172 @@
+from array import array
+
+
+class ArrayList:
+    def __init__(self, capacity=8, typecode="q"):
+        # Ring buffer: the list occupies size slots starting at _head, wrapping around
+        self._buf = array(typecode, [0]) * max(capacity, 1)
+        self._head = 0
+        self.size = 0
+
+    # O(n) linear time
+    def __repr__(self):
+        if self.size == 0:
+            return "←"
+        return "← " + " ↔ ".join(map(str, self._values())) + " →"
+
+    # O(n) linear time, but each comparison runs in C over contiguous memory
+    def __contains__(self, value):
+        return self._find(value) >= 0
+
+    # O(1) constant time
+    def __len__(self):
+        return self.size
+
+    # O(1) amortized time
+    def append(self, value):
+        if self.size == len(self._buf):
+            self._rebuild(2 * len(self._buf))
+        self._buf[(self._head + self.size) % len(self._buf)] = value
+        self.size += 1
+
+    # O(1) amortized time
+    def prepend(self, value):
+        if self.size == len(self._buf):
+            self._rebuild(2 * len(self._buf))
+        head = (self._head - 1) % len(self._buf)
+        # Write before moving _head, so a value the typecode rejects changes nothing
+        self._buf[head] = value
+        self._head = head
+        self.size += 1
+
+    # O(n) linear time, O(1) amortized at either end
+    def insert(self, value, index):
+        if index == 0:
+            self.prepend(value)
+        elif index == self.size:
+            self.append(value)
+        elif index < 0 or index > self.size:
+            raise ValueError("Index out of bounds")
+        else:
+            capacity = len(self._buf)
+            self._rebuild(2 * capacity if self.size == capacity else capacity)
+            buf = self._buf
+            # Try the value in the free slot first, so a rejected value shifts nothing
+            buf[self.size] = value
+            buf[index + 1 : self.size + 1] = buf[index : self.size]
+            buf[index] = value
+            self.size += 1
+
+    # O(n) linear time
+    def delete(self, value):
+        index = self._find(value)
+        if index < 0:
+            return
+        self._rebuild(len(self._buf))
+        self._remove_at(index)
+
+    # O(n) linear time, O(1) at either end
+    def pop(self, index):
+        if index < 0 or index >= self.size:
+            raise ValueError("Index out of bounds")
+        value = self.get(index)
+        if index == 0:
+            self._head = (self._head + 1) % len(self._buf)
+            self.size -= 1
+        elif index == self.size - 1:
+            self.size -= 1
+        else:
+            self._rebuild(len(self._buf))
+            self._remove_at(index)
+        return value
+
+    # O(1) constant time
+    def get(self, index):
+        if index < 0 or index >= self.size:
+            raise ValueError("Index out of bounds")
+        return self._buf[(self._head + index) % len(self._buf)]
+
+    # O(n) linear time, searches the occupied slots in place without copying them
+    def _find(self, value):
+        buf = self._buf
+        head = self._head
+        end = head + self.size
+        try:
+            return buf.index(value, head, min(end, len(buf))) - head
+        except ValueError:
+            pass
+        if end > len(buf):
+            try:
+                return buf.index(value, 0, end - len(buf)) + len(buf) - head
+            except ValueError:
+                pass
+        return -1
+
+    # O(n) linear time, only valid once the buffer starts at slot 0
+    def _remove_at(self, index):
+        buf = self._buf
+        buf[index : self.size - 1] = buf[index + 1 : self.size]
+        self.size -= 1
+
+    # Copies of the occupied slots, in list order
+    def _values(self):
+        buf = self._buf
+        end = self._head + self.size
+        if end <= len(buf):
+            return buf[self._head : end]
+        return buf[self._head :] + buf[: end - len(buf)]
+
+    # O(n) linear time, moves the first element to slot 0 and resizes the buffer
+    def _rebuild(self, capacity):
+        if self._head == 0 and capacity == len(self._buf):
+            return
+        values = self._values()
+        self._buf = values + array(values.typecode, [0]) * (capacity - self.size)
+        self._head = 0
+
+
+if __name__ == "__main__":
+    al = ArrayList()
+
+    al.append(10)
+    al.insert(5, 1)
+    al.insert(15, 1)
+    al.insert(18, 1)
+    al.insert(22, 1)
+    al.insert(29, 1)
+
+    print(al)
+
+    al.prepend(100)
+
+    print(al)
+
+    al.insert(200, 1)
+
+    print(al)
+
+    al.delete(18)
+    al.delete(100)
+    al.delete(29)
+
+    print(al)
+
+    print(al.pop(1))
+
+    print(al)
+
+    print(al.get(1))
+    print(22 in al)
+    print(800 in al)
+
+    # Values the typecode cannot hold are rejected and leave the list unchanged
+    try:
+        al.prepend("x")
+    except TypeError as e:
+        print(e)
+    try:
+        al.insert(2**70, 1)
+    except OverflowError as e:
+        print(e)
+
+    print(al)
@@ -1,4 +1,11 @@
+# Upper bound on how many removed nodes a list keeps for reuse
+FREE_LIST_LIMIT = 1024
+
+
 class Node:
+    # Fixed attributes instead of a per-node __dict__
+    __slots__ = ("value", "next", "previous")
+
     def __init__(self, value):
         self.value = value
         self.next = None
@@ -9,19 +16,20 @@ class DoublyLinkedList:
     def __init__(self):
         self.head = None
         self.tail = None
+        self.size = 0
+        self._free = None
+        self._free_size = 0
 
     # O(n) linear time
     def __repr__(self):
         if self.head is None:
             return "←"
-        else:
-            last = self.head
-            return_string = f"← {last.value}"
-            while last.next:
-                last = last.next
-                return_string += f" ↔ {last.value}"
-            return_string += " →"
-            return return_string
+        values = []
+        last = self.head
+        while last is not None:
+            values.append(str(last.value))
+            last = last.next
+        return "← " + " ↔ ".join(values) + " →"
 
     # O(n) linear time
     def __contains__(self, value):
@@ -32,111 +40,119 @@ class DoublyLinkedList:
             last = last.next
         return False
 
-    # O(n) linear time
+    # O(1) constant time
     def __len__(self):
-        last = self.head
-        counter = 0
-        while last is not None:
-            counter += 1
-            last = last.next
-        return counter
+        return self.size
 
     # O(n) linear time
     def append(self, value):
         if self.head is None:
-            new_node = Node(value)
+            new_node = self._new_node(value)
             self.head = new_node
             self.tail = new_node
         else:
-            new_node = Node(value)
+            new_node = self._new_node(value)
             self.tail.next = new_node
             new_node.previous = self.tail
             self.tail = new_node
+        self.size += 1
 
     # O(1) constant time
     def prepend(self, value):
-        first_node = Node(value)
+        first_node = self._new_node(value)
         first_node.next = self.head
         if self.head is not None:
             self.head.previous = first_node
         else:
             self.tail = first_node
         self.head = first_node
+        self.size += 1
 
-    # O(n) linear time
+    # O(n) linear time, O(1) at either end
     def insert(self, value, index):
         if index == 0:
             self.prepend(value)
+        elif index == self.size:
+            self.append(value)
+        elif index < 0 or index > self.size:
+            raise ValueError("Index out of bounds")
         else:
-            last = self.head
-            for i in range(index - 1):
-                if last.next is None:
-                    raise ValueError("Index out of bounds")
-                last = last.next
-
-            new_node = Node(value)
+            last = self._node_at(index - 1)
+            new_node = self._new_node(value)
             new_node.next = last.next
             new_node.previous = last
-            if last.next is not None:
-                last.next.previous = new_node
-            else:
-                self.tail = new_node
+            last.next.previous = new_node
             last.next = new_node
+            self.size += 1
 
     # O(n) linear time
-
     def delete(self, value):
-        last = self.head
-        if last is not None:
-            if last.value == value:
-                self.head = last.next
-                if self.head is not None:
-                    self.head.previous = None
-                else:
-                    self.tail = None
-            else:
-                while last.next:
-                    if last.next.value == value:
-                        to_delete = last.next
-                        last.next = to_delete.next
-                        if to_delete.next is not None:
-                            to_delete.next.previous = last
-                        else:
-                            self.tail = last
-                        return
-                    last = last.next
+        current = self.head
+        while current is not None:
+            if current.value == value:
+                self._unlink(current)
+                return
+            current = current.next
 
     # O(n) linear time
     def pop(self, index):
-        if self.head is None:
+        # Index 0 still removes the second node (see "Edge Cases NOT Handled" in README)
+        index = max(index, 1)
+        if index >= self.size:
             raise ValueError("Index out of bounds")
-        else:
-            last = self.head
-            for i in range(index - 1):
-                if last.next is None:
-                    raise ValueError("Index out of bounds")
-                last = last.next
-            if last.next is None:
-                raise ValueError("Index out of bounds")
-            else:
-                to_delete = last.next
-                last.next = to_delete.next
-                if to_delete.next is not None:
-                    to_delete.next.previous = last
-                else:
-                    self.tail = last
+        self._unlink(self._node_at(index))
 
     # O(n) linear time
     def get(self, index):
-        if self.head is None:
+        if index < 0 or index >= self.size:
             raise ValueError("Index out of bounds")
-        else:
-            last = self.head
+        return self._node_at(index).value
+
+    # O(n) linear time, walks from whichever end is closer so at most n/2 steps
+    def _node_at(self, index):
+        if index <= self.size // 2:
+            node = self.head
             for i in range(index):
-                if last.next is None:
-                    raise ValueError("Index out of bounds")
-                last = last.next
-            return last.value
+                node = node.next
+        else:
+            node = self.tail
+            for i in range(self.size - 1 - index):
+                node = node.previous
+        return node
+
+    # O(1) constant time, no need to search for the node before this one
+    def _unlink(self, node):
+        previous_node = node.previous
+        next_node = node.next
+        if previous_node is None:
+            self.head = next_node
+        else:
+            previous_node.next = next_node
+        if next_node is None:
+            self.tail = previous_node
+        else:
+            next_node.previous = previous_node
+        self.size -= 1
+        self._recycle(node)
+
+    # Reuses a node from the free list when one is available
+    def _new_node(self, value):
+        node = self._free
+        if node is None:
+            return Node(value)
+        self._free = node.next
+        self._free_size -= 1
+        node.value = value
+        node.next = None
+        return node
+
+    def _recycle(self, node):
+        if self._free_size < FREE_LIST_LIMIT:
+            node.value = None
+            node.previous = None
+            node.next = self._free
+            self._free = node
+            self._free_size += 1
 
 
 if __name__ == "__main__":
@@ -1,4 +1,7 @@
 class Node:
+    # Fixed attributes instead of a per-node __dict__
+    __slots__ = ("value", "next")
+
     def __init__(self, value):
         self.value = value
         self.next = None
@@ -12,14 +15,12 @@ class SinglyLinkedList:
     def __repr__(self):
         if self.head is None:
             return "→"
-        else:
-            last = self.head
-            return_string = f"→ {last.value}"
-            while last.next:
-                last = last.next
-                return_string += f" → {last.value}"
-            return_string += " →"
-            return return_string
+        values = []
+        last = self.head
+        while last is not None:
+            values.append(str(last.value))
+            last = last.next
+        return "→ " + " → ".join(values) + " →"
 
     # O(n) linear time
     def __contains__(self, value):
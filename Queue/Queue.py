@@ -1,62 +1,40 @@
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.next = None
+from collections import deque
 
 
 class Queue:
     def __init__(self):
-        self.front = None
-        self.rear = None
-        self.size = 0
+        # The front of the queue is the left end of the deque
+        self._data = deque()
 
     # O(1) constant time
     def __len__(self):
-        return self.size
+        return len(self._data)
 
     # O(n) linear time
     def __repr__(self):
-        items = []
-        current = self.front
-        while current is not None:
-            items.append(str(current.value))
-            current = current.next
-        return "Queue: " + " -> ".join(items)
+        return "Queue: " + " -> ".join(map(str, self._data))
 
     # O(1) constant time
     def enqueue(self, value):
-        new_node = Node(value)
-        if self.rear is None:
-            self.front = new_node
-            self.rear = new_node
-        else:
-            self.rear.next = new_node
-            self.rear = new_node
-        self.size += 1
+        self._data.append(value)
 
     # O(1) constant time
     def dequeue(self):
-        if self.front is None:
-            raise IndexError("Queue is empty")
-
-        dequeue_value = self.front.value
-        self.front = self.front.next
-
-        if self.front is None:
-            self.rear = None
-
-        self.size -= 1
-        return dequeue_value
+        try:
+            return self._data.popleft()
+        except IndexError:
+            raise IndexError("Queue is empty") from None
 
     # O(1) constant time
     def peek(self):
-        if self.front is None:
-            raise IndexError("Queue is empty")
-        return self.front.value
+        try:
+            return self._data[0]
+        except IndexError:
+            raise IndexError("Queue is empty") from None
 
     # O(1) constant time
     def is_empty(self):
-        return self.front is None
+        return not self._data
 
 
 if __name__ == "__main__":
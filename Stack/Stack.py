@@ -1,51 +1,39 @@
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.next = None
-        
 class Stack:
     def __init__(self):
-        self.top = None
-        self.size = 0
-        
+        # The top of the stack is the end of the list
+        self._data = []
+
     # O(1) constant time
     def __len__(self):
-        return self.size
-    
+        return len(self._data)
+
+    # O(n) linear time
     def __repr__(self):
-        items = []
-        current = self.top
-        while current is not None:
-            items.append(str(current.value))
-            current = current.next
-        return "Stack: " + " -> ".join(items)
-    
+        return "Stack: " + " -> ".join(map(str, reversed(self._data)))
+
     # O(1) constant time
     def push(self, value):
-        new_node = Node(value)
-        new_node.next = self.top
-        self.top = new_node
-        self.size += 1             
-        
-    # O(1) constant time    
-    def pop (self):
-        if self.top is None:
-            raise ValueError("Stack is empty")
-        pop_value = self.top.value
-        self.top = self.top.next
-        self.size -= 1
-        return pop_value
+        self._data.append(value)
+
+    # O(1) constant time
+    def pop(self):
+        try:
+            return self._data.pop()
+        except IndexError:
+            raise ValueError("Stack is empty") from None
 
     # O(1) constant time
     def peek(self):
-        if self.top is None:
-            raise ValueError("Stack is empty")
-        return self.top.value
-    
+        try:
+            return self._data[-1]
+        except IndexError:
+            raise ValueError("Stack is empty") from None
+
+    # O(1) constant time
     def is_empty(self):
-        return self.top is None
-    
-    
+        return not self._data
+
+
 if __name__ == "__main__":
     stack = Stack()
     stack.push(1)
@@ -60,4 +48,3 @@ if __name__ == "__main__":
     stack.pop()
     stack.pop()
     print(stack.is_empty())  # True
-    
\ No newline at end of file